@@ -1,57 +1,185 @@
-from fastapi import Request, status
+import asyncio
+import hashlib
+import time
+import uuid
+from fastapi import Request, Response, status
 from fastapi.responses import RedirectResponse
 from fastapi.responses import JSONResponse
-from typing import Callable
 
+from cachetools import TTLCache
 from jose import ExpiredSignatureError
 from loguru import logger
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from ..auth.handler import AuthHandler
 from ..auth.managers import UserManager
 from ..config import config
 
+_ADMIN_PREFIX = "/admin"
+# Статика sqladmin не содержит пользовательских данных, поэтому отдается без проверки прав.
+# Завершающий слэш обязателен: иначе префиксу соответствовали бы представления вида /admin/statics-report
+_ADMIN_STATICS_PREFIX = "/admin/statics/"
+_STATICS_CACHE_CONTROL = "public, max-age=86400"
 
-class AdminPermissionMiddleware(BaseHTTPMiddleware):
-    """Middleware для проверки прав администратора.
+# Кэш успешных проверок: sha256(access_token) -> время истечения токена
+_admin_cache: TTLCache[str, float] = TTLCache(
+    maxsize=config.auth_config.ADMIN_CACHE_MAXSIZE,
+    ttl=config.auth_config.ADMIN_CACHE_TTL,
+)
+
+
+class AdminPermissionMiddleware:
+    """ASGI middleware для проверки прав администратора.
+
+    Реализован как чистый ASGI middleware (без BaseHTTPMiddleware), чтобы не
+    создавать дополнительную задачу и потоки памяти на каждый запрос.
 
     Алгоритм работы:
-    1. Пропускает все запросы не к /admin маршрутам
+    1. Пропускает все запросы не к /admin маршрутам, а статику админки
+       отдает без проверки прав с заголовком кэширования
     2. Для /admin маршрутов:
-       a. Извлекает access_token из cookies
+       a. Извлекает access_token из cookies (если токен недавно прошел
+          проверку и еще не истек - сразу пропускает запрос)
        b. Декодирует токен и получает user_id
        c. Проверяет активную сессию в Redis
-       d. Ищет пользователя в базе данных
+       d. Ищет пользователя в списке администраторов в памяти, а при
+          отсутствии - в базе данных
        e. Проверяет флаг is_superuser
-       f. Если проверки пройдены - пропускает запрос
+       f. Если проверки пройдены - кэширует результат и пропускает запрос
        g. Если нет - возвращает соответствующую ошибку
+
+    Attributes:
+        app: Следующее ASGI приложение в цепочке
+        admin_ids: Идентификаторы администраторов, периодически обновляемые
+            фоновой задачей refresh_admin_ids
     """
+    admin_ids: frozenset[uuid.UUID] = frozenset()
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Обрабатывает ASGI запрос и проверяет права администратора.
+
+        Args:
+            scope: ASGI scope запроса
+            receive: ASGI канал получения сообщений
+            send: ASGI канал отправки сообщений
+        """
+        # Шаг 1: Пропускаем запросы не к /admin
+        if scope["type"] != "http" or not scope["path"].startswith(_ADMIN_PREFIX):
+            await self.app(scope, receive, send)
+            return
+
+        if scope["path"].startswith(_ADMIN_STATICS_PREFIX):
+            await self.app(scope, receive, self._with_cache_control(send))
+            return
+
+        # Шаг 2: Проверяем права, при ошибке отдаем ответ сразу
+        error_response = await self._check_permissions(Request(scope))
+        if error_response is not None:
+            await error_response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    def _with_cache_control(send: Send) -> Send:
+        """Оборачивает send, добавляя заголовок кэширования в успешный ответ.
+
+        Ответы с ошибками (например, 404 для отсутствующего файла) не кэшируются.
+
+        Args:
+            send: ASGI канал отправки сообщений
+
+        Returns:
+            Send: Обертка над send
+        """
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and (
+                    200 <= message["status"] < 300 or message["status"] == status.HTTP_304_NOT_MODIFIED
+            ):
+                MutableHeaders(scope=message)["Cache-Control"] = _STATICS_CACHE_CONTROL
+            await send(message)
+
+        return send_wrapper
+
+    @staticmethod
+    async def _is_superuser(request: Request, user_id: str) -> bool:
+        """Проверяет, является ли пользователь администратором.
 
-    async def dispatch(self, request: Request, call_next: Callable):
-        """Обрабатывает HTTP запрос и проверяет права администратора.
+        Сначала ищет пользователя в списке администраторов в памяти. Сессия БД
+        открывается только если его там нет (например, права выданы после
+        последнего обновления списка).
 
         Args:
             request: Входящий HTTP запрос
-            call_next: Функция для вызова следующего middleware/обработчика
+            user_id: Идентификатор пользователя из токена
 
         Returns:
-            Response: Ответ сервера или JSON с ошибкой доступа
+            bool: True если пользователь является суперпользователем
+
+        Raises:
+            Exception: Если пользователь не найден
+        """
+        user_uuid = uuid.UUID(user_id)
+        if user_uuid in AdminPermissionMiddleware.admin_ids:
+            return True
+
+        database_manager = request.app.state.db_manager
+        async with database_manager.readonly_session() as session:
+            is_superuser = await UserManager.is_superuser(session, user_uuid)
+        if is_superuser is None:
+            raise Exception('Нету такого пользователя')
+        return is_superuser
+
+    @classmethod
+    async def refresh_admin_ids(cls, database_manager, interval: int) -> None:
+        """Фоновая задача, периодически обновляющая список администраторов.
+
+        Запускается в lifespan приложения. Ошибки обновления логируются,
+        при этом остается предыдущий список.
+
+        Args:
+            database_manager: Менеджер сессий базы данных
+            interval: Период обновления (в секундах)
+        """
+        while True:
+            try:
+                async with database_manager.readonly_session() as session:
+                    cls.admin_ids = await UserManager.find_superuser_ids(session)
+                logger.debug("Список администраторов обновлен: {}", len(cls.admin_ids))
+            except Exception as e:
+                logger.error("Ошибка обновления списка администраторов: {}", e)
+            await asyncio.sleep(interval)
+
+    async def _check_permissions(self, request: Request) -> Response | None:
+        """Проверяет права администратора для запроса к /admin.
+
+        Args:
+            request: Входящий HTTP запрос
+
+        Returns:
+            Response | None: Ответ с ошибкой доступа или None, если доступ разрешен
 
         Примеры ошибок:
             - 401: Проблемы с аутентификацией
             - 403: Нет прав администратора
             - 404: Пользователь не найден
         """
-        # Шаг 1: Пропускаем запросы не к /admin
-        if not request.url.path.startswith("/admin"):
-            return await call_next(request)
-
         try:
             # Шаг 2a: Получаем токен из cookies
             token = request.cookies.get("access_token")
             if not token:
                 raise Exception('Нету токена')
 
+            # В кэше хранится только хэш токена, сам токен не сохраняется
+            cache_key = hashlib.sha256(token.encode()).hexdigest()
+            expires_at = _admin_cache.get(cache_key)
+            if expires_at is not None and expires_at > time.time():
+                return None
+
             # Шаг 2b: Декодируем токен
             decoded_token = await AuthHandler.decode_jwt(token)
             user_id = decoded_token.get("sub")
@@ -64,29 +192,23 @@ class AdminPermissionMiddleware(BaseHTTPMiddleware):
                 if not await client.get(f"session:{user_id}"):
                     raise Exception('Вашей сессии нету в базе')
 
-            # Шаг 2d: Ищем пользователя в БД
-            database_manager = request.app.state.db_manager
-            async with database_manager.session() as session:
-                user = await UserManager.find_by_id(session, user_id)
-                if user is None:
-                    raise Exception('Нету такого пользователя')
-
-                # Шаг 2e: Проверяем права администратора
-                if not user.is_superuser:
-                    logger.warning(f"Попытка доступа в админ-зону без прав: {request.url}")
-                    return JSONResponse(
-                        status_code=status.HTTP_403_FORBIDDEN,
-                        content={"detail": "Доступ запрещен. Требуются права администратора"}
-                    )
+            # Шаг 2d-2e: Проверяем права администратора в БД
+            if not await self._is_superuser(request, user_id):
+                logger.warning("Попытка доступа в админ-зону без прав: {}", request.url)
+                return JSONResponse(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    content={"detail": "Доступ запрещен. Требуются права администратора"}
+                )
 
             # Шаг 2f: Все проверки пройдены
-            return await call_next(request)
+            _admin_cache[cache_key] = decoded_token.get("exp", 0)
+            return None
 
         except ExpiredSignatureError:
             return RedirectResponse(url=f'{config.auth_config.REFRESH_ROUTE}?redirect_url={str(request.url)}')
         except Exception as e:
             # Обработка непредвиденных ошибок
-            logger.error(f"Ошибка проверки прав администратора: {str(e)}")
+            logger.error("Ошибка проверки прав администратора: {}", e)
             response = JSONResponse(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 content={"detail": f"Ошибка авторизации: {str(e)}"}
@@ -42,7 +42,7 @@ class AdminService:
 
         Алгоритм работы:
         1. Итерируется по ключам Redis с шаблоном 'session:*'
-        2. Для каждого ключа получает user_id
+        2. Для каждой пачки ключей получает user_id одним запросом MGET
         3. Находит пользователя в БД по user_id
         4. Формирует словарь {username: user_id}
 
@@ -63,8 +63,9 @@ class AdminService:
 
             while True:
                 cursor, keys = await redis_client.scan(cursor, match=pattern, count=1000)
-                for key in keys:
-                    user_id = await redis_client.get(key)
+                # Значения всей пачки ключей получаем за один запрос
+                user_ids = await redis_client.mget(keys) if keys else []
+                for user_id in user_ids:
                     if not user_id:
                         continue
 
@@ -121,9 +122,8 @@ class AdminService:
         """
         try:
             sessions = await self.get_all_sessions(redis_client, db_session)
-            for user_id in sessions.values():
-                key = f"session:{user_id}"
-                await redis_client.delete(key)
+            if sessions:
+                await redis_client.delete(*(f"session:{user_id}" for user_id in sessions.values()))
             logger.info(f"Удалено {len(sessions)} сессий")
         except Exception as e:
             logger.error(f'Ошибка удаления сессий: {e}')
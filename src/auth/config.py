@@ -1,6 +1,8 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pathlib import Path
 
+_ENV_FILE = Path(__file__).resolve().parents[2] / ".env"
+
 
 class AuthConfig(BaseSettings):
     """Класс конфигурации авторизации.
@@ -13,6 +15,9 @@ class AuthConfig(BaseSettings):
         ACCESS_TOKEN_EXPIRE: Время жизни access токена (в минутах)
         LOGIN_ROUTE: Путь входа
         REFRESH_ROUTE: Путь обновления токена
+        ADMIN_CACHE_TTL: Время жизни записи в кэше проверок админ-доступа (в секундах)
+        ADMIN_CACHE_MAXSIZE: Максимальное количество токенов в кэше проверок админ-доступа
+        ADMIN_IDS_REFRESH_INTERVAL: Период обновления списка администраторов в памяти (в секундах)
     """
     # Настройки аутентификации
     SECRET_KEY: str
@@ -24,8 +29,13 @@ class AuthConfig(BaseSettings):
     REFRESH_ROUTE: str = "/auth/refresh"
     HOME_ROUTE: str = "/"
 
+    # Кэш проверок доступа к админке
+    ADMIN_CACHE_TTL: int = 10
+    ADMIN_CACHE_MAXSIZE: int = 10_000
+    ADMIN_IDS_REFRESH_INTERVAL: int = 60
+
     model_config = SettingsConfigDict(
-        env_file=Path(__file__).parent.parent.parent / ".env",
+        env_file=_ENV_FILE,
         env_file_encoding='utf-8',
         extra="ignore"
     )
@@ -1,5 +1,6 @@
 from pydantic import SecretStr
 from datetime import datetime, timedelta, timezone
+from fastapi.concurrency import run_in_threadpool
 from jose import jwt
 from passlib.context import CryptContext
 
@@ -18,13 +19,15 @@ class AuthHandler:
     async def get_password_hash(self, password: SecretStr) -> str:
         """Генерирует хеш пароля.
 
+        Хеширование bcrypt - блокирующая CPU-операция, поэтому выполняется в пуле потоков.
+
         Args:
             password: Пароль в чистом виде (обернутый в SecretStr для безопасности)
 
         Returns:
             str: Хешированная строка пароля
         """
-        return self._pwd_context.hash(password.get_secret_value())
+        return await run_in_threadpool(self._pwd_context.hash, password.get_secret_value())
 
     async def verify_password(
             self,
@@ -33,6 +36,8 @@ class AuthHandler:
     ) -> bool:
         """Проверяет соответствие пароля и его хеша.
 
+        Проверка bcrypt - блокирующая CPU-операция, поэтому выполняется в пуле потоков.
+
         Args:
             plain_password: Пароль в чистом виде
             hashed_password: Хешированный пароль для проверки
@@ -40,7 +45,7 @@ class AuthHandler:
         Returns:
             bool: True если пароль верный, иначе False
         """
-        return self._pwd_context.verify(plain_password, hashed_password)
+        return await run_in_threadpool(self._pwd_context.verify, plain_password, hashed_password)
 
     @staticmethod
     async def encode_jwt(
@@ -1,3 +1,7 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import UUID
+
 from ..database.manager import BaseManager
 from .models import User
 
@@ -5,3 +9,34 @@ from .models import User
 class UserManager(BaseManager):
     """Менеджер пользователей"""
     model = User
+
+    @classmethod
+    async def is_superuser(cls, session: AsyncSession, index: UUID) -> bool | None:
+        """Получает флаг суперпользователя без загрузки всей записи.
+
+        Args:
+            session: Асинхронная сессия SQLAlchemy
+            index: UUID пользователя
+
+        Returns:
+            bool | None: Флаг суперпользователя или None, если пользователь не найден
+        """
+        result = await session.execute(
+            select(cls.model.is_superuser).where(cls.model.id == index)
+        )
+        return result.scalar_one_or_none()
+
+    @classmethod
+    async def find_superuser_ids(cls, session: AsyncSession) -> frozenset[UUID]:
+        """Получает идентификаторы всех суперпользователей.
+
+        Args:
+            session: Асинхронная сессия SQLAlchemy
+
+        Returns:
+            frozenset[UUID]: Множество UUID суперпользователей
+        """
+        result = await session.execute(
+            select(cls.model.id).where(cls.model.is_superuser.is_(True))
+        )
+        return frozenset(result.scalars().all())
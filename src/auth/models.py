@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import text, Boolean, String
+from sqlalchemy import text, Boolean, String, Index
 
 from ..database.model import Base
 
@@ -16,6 +16,15 @@ class User(Base):
         is_verified (bool): Флаг подтверждения пользователя. По умолчанию False.
         # role (str): Роль пользователя в системе. По умолчанию 'user'.
     """
+    __table_args__ = (
+        # Покрывающий индекс для проверки доступа в админку (index-only scan)
+        Index(
+            "ix_users_admin_check",
+            "id",
+            postgresql_include=["is_active", "is_superuser"],
+        ),
+    )
+
     username: Mapped[str] = mapped_column(
         String(20),
         nullable=False,
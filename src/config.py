@@ -1,13 +1,16 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import EmailStr, HttpUrl
+from pydantic import EmailStr, HttpUrl, Field
 from pathlib import Path
 from loguru import logger
 from fastapi.templating import Jinja2Templates
 
-from .redis_database.config import RedisConfig
+from .redis_database.config import RedisConfig, get_redis_config
 from .auth.config import AuthConfig
 from .database.config import DatabaseConfig
 
+# Путь к .env файлу в корне проекта, вычисляется один раз при импорте
+_ENV_FILE = Path(__file__).resolve().parents[1] / ".env"
+
 
 class LoggerConfig(BaseSettings):
     """Класс конфигурации логирования.
@@ -17,6 +20,7 @@ class LoggerConfig(BaseSettings):
     Attributes:
         ROTATION: При каком условии происходит ротация логов
         LEVEL: Уровень логирования
+        CONSOLE_LEVEL: Уровень логирования в консоль (stderr)
         COMPRESSION: Формат сжатия логов
         BACKTRACE: Включает подробный трейсбек при ошибках
         DIAGNOSE: Добавляет информацию о переменных в стектрейс
@@ -25,6 +29,7 @@ class LoggerConfig(BaseSettings):
     """
     ROTATION: str | None = None
     LEVEL: str | None = None
+    CONSOLE_LEVEL: str = "WARNING"
     COMPRESSION: str | None = None
     BACKTRACE: bool
     DIAGNOSE: bool
@@ -32,7 +37,7 @@ class LoggerConfig(BaseSettings):
     CATCH: bool
 
     model_config = SettingsConfigDict(
-        env_file=Path(__file__).parent.parent / ".env",
+        env_file=_ENV_FILE,
         env_file_encoding='utf-8',
         extra="ignore"
     )
@@ -57,7 +62,7 @@ class Config(BaseSettings):
     database_config: DatabaseConfig = DatabaseConfig()
     auth_config: AuthConfig = AuthConfig()
     logger_config: LoggerConfig = LoggerConfig()
-    redis_config: RedisConfig = RedisConfig()
+    redis_config: RedisConfig = Field(default_factory=get_redis_config)
 
     # Настройка приложения
     TITLE: str = 'FastAPI'
@@ -73,7 +78,7 @@ class Config(BaseSettings):
     ROOT_PATH: str | None = None
 
     model_config = SettingsConfigDict(
-        env_file=Path(__file__).parent.parent / ".env",
+        env_file=_ENV_FILE,
         env_file_encoding='utf-8',
         extra="ignore"
     )
@@ -1,6 +1,9 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from functools import cached_property
 from pathlib import Path
 
+_ENV_FILE = Path(__file__).resolve().parents[2] / ".env"
+
 
 class DatabaseConfig(BaseSettings):
     """Класс конфигурации базы данных.
@@ -13,6 +16,15 @@ class DatabaseConfig(BaseSettings):
         POSTGRES_DB: Имя базы данных
         POSTGRES_USER: Пользователь БД
         POSTGRES_PASSWORD: Пароль пользователя БД
+        DB_POOL_SIZE: Количество постоянных соединений в пуле
+        DB_MAX_OVERFLOW: Количество дополнительных соединений сверх пула
+        DB_POOL_RECYCLE: Время жизни соединения в пуле (в секундах)
+        DB_POOL_TIMEOUT: Время ожидания свободного соединения (в секундах)
+        DB_POOL_PRE_PING: Проверять соединение перед выдачей из пула
+        DB_POOL_WARMUP: Открывать соединения пула заранее при запуске приложения
+        DB_QUERY_CACHE_SIZE: Размер кэша скомпилированных SQL выражений SQLAlchemy
+        DB_PREPARED_STATEMENT_CACHE_SIZE: Размер кэша подготовленных выражений asyncpg на соединение
+        DB_INSERTMANYVALUES_PAGE_SIZE: Максимальное количество строк в одном INSERT при массовой вставке
     """
     # Настройки базы данных
     DB_HOST: str
@@ -21,14 +33,45 @@ class DatabaseConfig(BaseSettings):
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str
 
+    # Настройки пула соединений
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_TIMEOUT: int = 5
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_WARMUP: bool = True
+
+    # Настройки кэширования запросов
+    DB_QUERY_CACHE_SIZE: int = 1200
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 500
+
+    # Настройки массовой вставки
+    DB_INSERTMANYVALUES_PAGE_SIZE: int = 1000
+
     model_config = SettingsConfigDict(
-        env_file=Path(__file__).parent.parent.parent / ".env",
+        env_file=_ENV_FILE,
         env_file_encoding='utf-8',
         extra="ignore"
     )
 
-    @property
+    @cached_property
     def database_url(self) -> str:
-        """Генерирует URL для подключения к PostgreSQL с использованием asyncpg."""
+        """Генерирует URL для подключения к PostgreSQL с использованием asyncpg (один раз на экземпляр)."""
         return (f'postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@'
-                f'{self.DB_HOST}:{self.DB_PORT}/{self.POSTGRES_DB}')
\ No newline at end of file
+                f'{self.DB_HOST}:{self.DB_PORT}/{self.POSTGRES_DB}')
+
+    @property
+    def engine_options(self) -> dict:
+        """Возвращает параметры для создания асинхронного движка SQLAlchemy."""
+        return {
+            "pool_size": self.DB_POOL_SIZE,
+            "max_overflow": self.DB_MAX_OVERFLOW,
+            "pool_recycle": self.DB_POOL_RECYCLE,
+            "pool_timeout": self.DB_POOL_TIMEOUT,
+            "pool_pre_ping": self.DB_POOL_PRE_PING,
+            "query_cache_size": self.DB_QUERY_CACHE_SIZE,
+            "insertmanyvalues_page_size": self.DB_INSERTMANYVALUES_PAGE_SIZE,
+            "connect_args": {
+                "prepared_statement_cache_size": self.DB_PREPARED_STATEMENT_CACHE_SIZE,
+            },
+        }
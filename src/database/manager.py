@@ -1,9 +1,10 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, func
+from sqlalchemy import select, insert, update, delete, func, bindparam, literal
 from sqlalchemy.exc import SQLAlchemyError
+from functools import lru_cache
 from typing import Sequence, TypeVar, Generic
 from pydantic import BaseModel
-from uuid import UUID
+from uuid import UUID, uuid4
 from loguru import logger
 
 from ..database.model import Base
@@ -11,6 +12,76 @@ from ..database.model import Base
 T = TypeVar('T', bound=Base)
 
 
+def _dump(values: BaseModel) -> dict:
+    """Возвращает явно заданные поля Pydantic модели.
+
+    Аналог model_dump(exclude_unset=True) для плоских схем: значения читаются
+    напрямую из __dict__ без прохода через сериализатор. Вложенные модели
+    не преобразуются в словари. Дополнительные поля (extra='allow') хранятся
+    в __pydantic_extra__ и берутся оттуда.
+
+    Args:
+        values: Pydantic модель
+
+    Returns:
+        dict: Словарь заданных полей и их значений
+    """
+    fields = values.__dict__
+    extra = values.__pydantic_extra__
+    if not extra:
+        return {key: fields[key] for key in values.__pydantic_fields_set__}
+    return {
+        key: fields[key] if key in fields else extra[key]
+        for key in values.__pydantic_fields_set__
+    }
+
+
+@lru_cache(maxsize=128)
+def _compiled_statement(kind: str, model: type[Base], keys: tuple[str, ...], null_keys: tuple[str, ...]):
+    """Строит шаблон запроса с фильтрами для набора ключей и кэширует его.
+
+    Значения фильтров передаются при выполнении через bindparam, поэтому один
+    шаблон переиспользуется для любых значений с тем же набором ключей.
+
+    Args:
+        kind: Тип запроса ('select', 'count', 'exists' или 'delete')
+        model: Класс SQLAlchemy модели
+        keys: Отсортированные ключи фильтров со значениями
+        null_keys: Отсортированные ключи фильтров со значением None (IS NULL)
+
+    Returns:
+        Шаблон запроса SQLAlchemy
+    """
+    criteria = [getattr(model, key) == bindparam(key) for key in keys]
+    criteria += [getattr(model, key).is_(None) for key in null_keys]
+    if kind == "select":
+        query = select(model)
+    elif kind == "count":
+        query = select(func.count()).select_from(model)
+    elif kind == "exists":
+        query = select(literal(1)).select_from(model).limit(1)
+    else:
+        # Значения bindparam недоступны для синхронизации через 'evaluate'
+        query = delete(model).execution_options(synchronize_session="fetch")
+    return query.where(*criteria)
+
+
+def _filter_statement(kind: str, model: type[Base], filters_dict: dict):
+    """Возвращает закэшированный шаблон запроса и параметры для фильтров.
+
+    Args:
+        kind: Тип запроса ('select', 'count', 'exists' или 'delete')
+        model: Класс SQLAlchemy модели
+        filters_dict: Словарь фильтров
+
+    Returns:
+        tuple: Шаблон запроса и словарь значений параметров
+    """
+    params = {key: value for key, value in filters_dict.items() if value is not None}
+    null_keys = tuple(sorted(key for key, value in filters_dict.items() if value is None))
+    return _compiled_statement(kind, model, tuple(sorted(params)), null_keys), params
+
+
 class BaseManager(Generic[T]):
     """Базовый сервис для CRUD-операций с SQLAlchemy моделями.
 
@@ -20,10 +91,13 @@ class BaseManager(Generic[T]):
 
     Attributes:
         model: Класс SQLAlchemy модели, с которой работает сервис
+        use_orm_delete: Удалять по ID через ORM (session.delete), если модели нужны
+            каскады и ORM-события. По умолчанию удаление выполняется одним DELETE
 
     Methods:
         add: Создание новой записи
         add_all: Массовое создание записей
+        bulk_copy: Массовая загрузка больших объемов записей через COPY
         find_by_id: Поиск записи по ID
         find_one_by: Поиск одной записи по фильтрам
         find_all: Поиск всех записей по фильтрам
@@ -31,8 +105,11 @@ class BaseManager(Generic[T]):
         update_all: Массовое обновление записей
         delete_by_id: Удаление записи по ID
         delete_all: Массовое удаление записей
+        count: Подсчет записей по фильтрам
+        exists: Проверка существования записи по фильтрам
     """
     model = type[T]
+    use_orm_delete: bool = False
 
     def __init__(self):
         """Инициализация базового сервиса.
@@ -44,12 +121,19 @@ class BaseManager(Generic[T]):
             raise ValueError("Модель должна быть указана в дочернем классе")
 
     @classmethod
-    async def add(cls, session: AsyncSession, values: BaseModel) -> model:
+    async def add(cls, session: AsyncSession, values: BaseModel, flush: bool = True) -> model:
         """Создает новую запись в базе данных.
 
+        По умолчанию запись сразу отправляется в БД (flush): заполняется id, а
+        последующие запросы в той же сессии видят новую запись. С flush=False
+        запись уйдет в БД только при commit сессии: до этого id не заполнен,
+        запросы в сессии ее не видят (autoflush отключен), а ошибки ограничений
+        (IntegrityError) возникнут при commit.
+
         Args:
             session: Асинхронная сессия SQLAlchemy
             values: Pydantic модель с данными для создания
+            flush: Сразу отправить запись в БД (False - отложить до commit)
 
         Returns:
             T: Созданный экземпляр модели
@@ -57,15 +141,16 @@ class BaseManager(Generic[T]):
         Raises:
             SQLAlchemyError: При ошибках работы с базой данных
         """
-        values_dict = values.model_dump(exclude_unset=True)
-        logger.info(f"Добавление записи {cls.model.__name__} с параметрами: {values_dict}")
+        values_dict = _dump(values)
+        logger.info("Добавление записи {} с параметрами: {}", cls.model.__name__, values_dict)
         try:
             new_object = cls.model(**values_dict)
             session.add(new_object)
-            await session.flush()
-            logger.info(f"Запись {cls.model.__name__} успешно добавлена.")
+            if flush:
+                await session.flush()
+            logger.info("Запись {} успешно добавлена.", cls.model.__name__)
         except SQLAlchemyError as e:
-            logger.error(f"Ошибка при добавлении записи: {e}")
+            logger.error("Ошибка при добавлении записи: {}", e)
             raise e
         return new_object
 
@@ -73,6 +158,9 @@ class BaseManager(Generic[T]):
     async def add_all(cls, session: AsyncSession, instances: list[BaseModel]) -> Sequence[model]:
         """Массово создает записи в базе данных.
 
+        Записи вставляются одним INSERT ... RETURNING (SQLAlchemy сам разбивает
+        большие списки на пачки), без поштучной обработки через unit of work.
+
         Args:
             session: Асинхронная сессия SQLAlchemy
             instances: Список Pydantic моделей для создания
@@ -83,18 +171,82 @@ class BaseManager(Generic[T]):
         Raises:
             SQLAlchemyError: При ошибках работы с базой данных
         """
-        instances_list = [instance.model_dump(exclude_unset=True) for instance in instances]
-        logger.info(f"Добавление нескольких записей {cls.model.__name__}. Количество: {len(instances)}")
+        instances_list = [_dump(instance) for instance in instances]
+        logger.info("Добавление нескольких записей {}. Количество: {}", cls.model.__name__, len(instances))
+        if not instances_list:
+            return []
         try:
-            new_objects = [cls.model(**values) for values in instances_list]
-            session.add_all(new_objects)
-            await session.flush()
-            logger.info(f"Записи добавились")
+            result = await session.scalars(
+                insert(cls.model).returning(cls.model),
+                instances_list,
+            )
+            new_objects = result.all()
+            logger.info("Записи добавились")
         except SQLAlchemyError as e:
-            logger.error(f"Ошибка при добавлении записей: {e}")
+            logger.error("Ошибка при добавлении записей: {}", e)
             raise e
         return new_objects
 
+    @classmethod
+    async def bulk_copy(cls, session: AsyncSession, instances: list[BaseModel]) -> int:
+        """Массово загружает записи через COPY (только PostgreSQL + asyncpg).
+
+        Самый быстрый способ вставки больших объемов данных: вместо INSERT
+        выполняется один поток COPY. В отличие от add_all не возвращает созданные
+        объекты и не вызывает ORM-события. Если id не передан, он генерируется здесь.
+
+        Args:
+            session: Асинхронная сессия SQLAlchemy
+            instances: Список Pydantic моделей с одинаковым набором заданных полей
+
+        Returns:
+            int: Количество загруженных записей
+
+        Raises:
+            RuntimeError: Если драйвер базы данных не asyncpg
+            ValueError: Если у моделей разный набор заданных полей
+            asyncpg.PostgresError: При ошибках выполнения COPY
+        """
+        instances_list = [_dump(instance) for instance in instances]
+        logger.info("Загрузка записей {} через COPY. Количество: {}", cls.model.__name__, len(instances_list))
+        if not instances_list:
+            return 0
+
+        columns = list(instances_list[0])
+        column_set = set(columns)
+        if any(values.keys() != column_set for values in instances_list):
+            raise ValueError("Для COPY у всех записей должен быть одинаковый набор полей")
+        generate_id = "id" not in column_set
+        records = [
+            (*(values[column] for column in columns), uuid4()) if generate_id
+            else tuple(values[column] for column in columns)
+            for values in instances_list
+        ]
+        if generate_id:
+            columns.append("id")
+
+        connection = await session.connection()
+        if connection.dialect.driver != "asyncpg":
+            raise RuntimeError("COPY поддерживается только для драйвера asyncpg")
+        try:
+            raw_connection = await connection.get_raw_connection()
+            driver_connection = raw_connection.driver_connection
+            if not driver_connection.is_in_transaction():
+                # Драйвер открывает транзакцию лениво: запускаем ее, чтобы COPY
+                # выполнился в транзакции сессии и откатывался вместе с ней
+                await connection.exec_driver_sql("SELECT 1")
+            await driver_connection.copy_records_to_table(
+                cls.model.__tablename__,
+                records=records,
+                columns=columns,
+            )
+            logger.info("Загружено {} записей.", len(records))
+        except Exception as e:
+            # COPY идет напрямую через драйвер, поэтому ошибки не оборачиваются в SQLAlchemyError
+            logger.error("Ошибка при загрузке записей через COPY: {}", e)
+            raise e
+        return len(records)
+
     @classmethod
     async def find_by_id(cls, session: AsyncSession, index: int | UUID) -> model:
         """Находит запись по первичному ключу.
@@ -111,10 +263,10 @@ class BaseManager(Generic[T]):
         """
         try:
             find_object = await session.get(cls.model, index)
-            logger.info(f"Запись {cls.model.__name__} с ID {index} найдена")
+            logger.info("Запись {} с ID {} найдена", cls.model.__name__, index)
             return find_object
         except SQLAlchemyError as e:
-            logger.error(f"Ошибка при поиске записи с ID {index}: {e}")
+            logger.error("Ошибка при поиске записи с ID {}: {}", index, e)
             raise e
 
     @classmethod
@@ -132,18 +284,18 @@ class BaseManager(Generic[T]):
             SQLAlchemyError: При ошибках работы с базой данных
         """
         if filters:
-            filters_dict = filters.model_dump(exclude_unset=True)
+            filters_dict = _dump(filters)
         else:
             filters_dict = {}
-        logger.info(f"Поиск одной записи {cls.model.__name__} по фильтрам: {filters_dict}")
+        logger.info("Поиск одной записи {} по фильтрам: {}", cls.model.__name__, filters_dict)
         try:
-            query = select(cls.model).filter_by(**filters_dict)
-            result = await session.execute(query)
+            query, params = _filter_statement("select", cls.model, filters_dict)
+            result = await session.execute(query, params)
             find_object = result.scalar_one_or_none()
-            logger.info(f"Запись {'найдена' if find_object else 'не найдена'} по фильтрам: {filters_dict}")
+            logger.info("Запись {} по фильтрам: {}", 'найдена' if find_object else 'не найдена', filters_dict)
             return find_object
         except SQLAlchemyError as e:
-            logger.error(f"Ошибка при поиске записи по фильтрам {filters_dict}: {e}")
+            logger.error("Ошибка при поиске записи по фильтрам {}: {}", filters_dict, e)
             raise e
 
     @classmethod
@@ -161,23 +313,23 @@ class BaseManager(Generic[T]):
             SQLAlchemyError: При ошибках работы с базой данных
         """
         if filters:
-            filters_dict = filters.model_dump(exclude_unset=True)
+            filters_dict = _dump(filters)
         else:
             filters_dict = {}
-        logger.info(f"Поиск записей {cls.model.__name__} по фильтрам: {filters_dict}")
+        logger.info("Поиск записей {} по фильтрам: {}", cls.model.__name__, filters_dict)
         try:
-            query = select(cls.model).filter_by(**filters_dict)
-            result = await session.execute(query)
+            query, params = _filter_statement("select", cls.model, filters_dict)
+            result = await session.execute(query, params)
             find_objects = result.scalars().all()
-            logger.info(f"Записи {'найдены' if find_objects else 'не найдены'} по фильтрам: {filters_dict}")
+            logger.info("Записи {} по фильтрам: {}", 'найдены' if find_objects else 'не найдены', filters_dict)
             return find_objects
         except SQLAlchemyError as e:
-            logger.error(f"Ошибка при поиске записей по фильтрам {filters_dict}: {e}")
+            logger.error("Ошибка при поиске записей по фильтрам {}: {}", filters_dict, e)
             raise e
 
     @classmethod
     async def update_by_id(cls, session: AsyncSession, index: int | UUID, values: BaseModel):
-        """Обновляет запись по ID.
+        """Обновляет запись по ID одним запросом UPDATE (без предварительного SELECT).
 
         Args:
             session: Асинхронная сессия SQLAlchemy
@@ -187,16 +339,18 @@ class BaseManager(Generic[T]):
         Raises:
             SQLAlchemyError: При ошибках работы с базой данных
         """
-        values_dict = values.model_dump(exclude_unset=True)
-        logger.info(f"Обновление записи {cls.model.__name__} по ID: {index}")
+        values_dict = _dump(values)
+        logger.info("Обновление записи {} по ID: {}", cls.model.__name__, index)
         try:
-            find_object = await session.get(cls.model, index)
-            for key, value in values_dict.items():
-                setattr(find_object, key, value)
-            await session.flush()
-            logger.info(f"Обновлена запись {cls.model.__name__} по ID: {index}.")
+            query = (
+                update(cls.model)
+                .where(cls.model.id == index)
+                .values(**values_dict)
+            )
+            await session.execute(query)
+            logger.info("Обновлена запись {} по ID: {}.", cls.model.__name__, index)
         except SQLAlchemyError as e:
-            logger.error(f"Ошибка при обновлении записи: {e}")
+            logger.error("Ошибка при обновлении записи: {}", e)
             raise e
 
     @classmethod
@@ -211,44 +365,60 @@ class BaseManager(Generic[T]):
         Raises:
             SQLAlchemyError: При ошибках работы с базой данных
         """
-        values_dict = values.model_dump(exclude_unset=True)
+        values_dict = _dump(values)
         if filters:
-            filters_dict = filters.model_dump(exclude_unset=True)
+            filters_dict = _dump(filters)
         else:
             filters_dict = {}
-        logger.info(f"Обновление записей {cls.model.__name__} по фильтру: {filters_dict} с параметрами: {values_dict}")
+        logger.info("Обновление записей {} по фильтру: {} с параметрами: {}", cls.model.__name__, filters_dict, values_dict)
         try:
             query = (
                 update(cls.model)
-                .where(**filters_dict)
+                .filter_by(**filters_dict)
                 .values(**values_dict)
             )
             result = await session.execute(query)
-            await session.flush()
-            logger.info(f"Обновлено {result.rowcount} записей.")
+            logger.info("Обновлено {} записей.", result.rowcount)
         except SQLAlchemyError as e:
-            logger.error(f"Ошибка при обновлении записей: {e}")
+            logger.error("Ошибка при обновлении записей: {}", e)
             raise e
 
     @classmethod
-    async def delete_by_id(cls, session: AsyncSession, index: int | UUID):
+    async def delete_by_id(cls, session: AsyncSession, index: int | UUID, flush: bool = True) -> int:
         """Удаляет запись по ID.
 
+        По умолчанию выполняется одним запросом DELETE. Если у менеджера включен
+        use_orm_delete - запись загружается и удаляется через ORM.
+
         Args:
             session: Асинхронная сессия SQLAlchemy
             index: ID или UUID записи
+            flush: Только для use_orm_delete: сразу отправить удаление в БД
+                (False - отложить до commit). Запрос DELETE выполняется сразу всегда
+
+        Returns:
+            int: Количество удаленных записей
 
         Raises:
             SQLAlchemyError: При ошибках работы с базой данных
         """
-        logger.info(f"Удаление записи {cls.model.__name__} по ID: {index}")
+        logger.info("Удаление записи {} по ID: {}", cls.model.__name__, index)
         try:
-            delete_object = await session.get(cls.model, index)
-            await session.delete(delete_object)
-            await session.flush()
-            logger.info(f"Запись была удалена")
+            if cls.use_orm_delete:
+                delete_object = await session.get(cls.model, index)
+                if delete_object is None or delete_object in session.deleted:
+                    return 0
+                await session.delete(delete_object)
+                if flush:
+                    await session.flush()
+                deleted = 1
+            else:
+                result = await session.execute(delete(cls.model).where(cls.model.id == index))
+                deleted = result.rowcount
+            logger.info("Удалено {} записей.", deleted)
+            return deleted
         except SQLAlchemyError as e:
-            logger.error(f"Ошибка при удалении записи: {e}")
+            logger.error("Ошибка при удалении записи: {}", e)
             raise e
 
     @classmethod
@@ -263,17 +433,16 @@ class BaseManager(Generic[T]):
             SQLAlchemyError: При ошибках работы с базой данных
         """
         if filters:
-            filters_dict = filters.model_dump(exclude_unset=True)
+            filters_dict = _dump(filters)
         else:
             filters_dict = {}
-        logger.info(f"Удаление записей {cls.model.__name__} по фильтру: {filters_dict}")
+        logger.info("Удаление записей {} по фильтру: {}", cls.model.__name__, filters_dict)
         try:
-            query = delete(cls.model).filter_by(**filters_dict)
-            result = await session.execute(query)
-            await session.flush()
-            logger.info(f"Удалено {result.rowcount} записей.")
+            query, params = _filter_statement("delete", cls.model, filters_dict)
+            result = await session.execute(query, params)
+            logger.info("Удалено {} записей.", result.rowcount)
         except SQLAlchemyError as e:
-            logger.error(f"Ошибка при удалении записей: {e}")
+            logger.error("Ошибка при удалении записей: {}", e)
             raise e
 
     @classmethod
@@ -290,14 +459,42 @@ class BaseManager(Generic[T]):
         Raises:
             SQLAlchemyError: При ошибках работы с базой данных
         """
-        filters_dict = filters.model_dump(exclude_unset=True) if filters else {}
-        logger.info(f"Подсчет количества записей {cls.model.__name__} по фильтру: {filters_dict}")
+        filters_dict = _dump(filters) if filters else {}
+        logger.info("Подсчет количества записей {} по фильтру: {}", cls.model.__name__, filters_dict)
         try:
-            query = select(func.count(cls.model.id)).filter_by(**filters_dict)
-            result = await session.execute(query)
+            query, params = _filter_statement("count", cls.model, filters_dict)
+            result = await session.execute(query, params)
             count = result.scalar()
-            logger.info(f"Найдено {count} записей.")
+            logger.info("Найдено {} записей.", count)
             return count
         except SQLAlchemyError as e:
-            logger.error(f"Ошибка при подсчете записей: {e}")
+            logger.error("Ошибка при подсчете записей: {}", e)
+            raise
+
+    @classmethod
+    async def exists(cls, session: AsyncSession, filters: BaseModel | None = None) -> bool:
+        """Проверяет, существует ли хотя бы одна запись, удовлетворяющая фильтрам.
+
+        В отличие от count не подсчитывает все подходящие строки: запрос
+        завершается на первой найденной записи (LIMIT 1).
+
+        Args:
+            session: Асинхронная сессия SQLAlchemy для работы с БД
+            filters: Pydantic модель с параметрами фильтрации (опционально)
+
+        Returns:
+            bool: True, если запись найдена
+
+        Raises:
+            SQLAlchemyError: При ошибках работы с базой данных
+        """
+        filters_dict = _dump(filters) if filters else {}
+        logger.info("Проверка существования записи {} по фильтру: {}", cls.model.__name__, filters_dict)
+        try:
+            query, params = _filter_statement("exists", cls.model, filters_dict)
+            found = await session.scalar(query, params) is not None
+            logger.info("Запись {}.", "найдена" if found else "не найдена")
+            return found
+        except SQLAlchemyError as e:
+            logger.error("Ошибка при проверке существования записи: {}", e)
             raise
@@ -1,10 +1,12 @@
-from sqlalchemy import text
+import asyncio
+import time
+from contextvars import ContextVar
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine, AsyncSession, AsyncEngine
-from functools import wraps
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from functools import wraps, lru_cache
 from fastapi import Depends
 from typing import Annotated, AsyncIterator, Optional
 from loguru import logger
-from datetime import datetime
 from contextlib import asynccontextmanager
 from fastapi import Request
 
@@ -12,6 +14,13 @@ from ..config import config
 
 SQL_DATABASE_URL = config.database_config.database_url
 
+# Сессия, открытая декоратором connection(), ее уровень изоляции и задача-владелец.
+# Контекст копируется в дочерние задачи (asyncio.gather, create_task), поэтому сессию
+# переиспользуют только вызовы из той же задачи: AsyncSession нельзя использовать конкурентно
+_current_session: ContextVar[tuple[AsyncSession, str | None, asyncio.Task | None] | None] = ContextVar(
+    "current_session", default=None
+)
+
 
 class DatabaseSessionManager:
     """Менеджер для управления асинхронными сессиями базы данных.
@@ -24,15 +33,21 @@ class DatabaseSessionManager:
 
     Attributes:
         database_url (str): URL для подключения к БД
+        engine_options (dict): Параметры создания движка (настройки пула и т.д.)
+        pool_warmup (bool): Открывать соединения пула заранее при инициализации
         engine (Optional[AsyncEngine]): Асинхронный движок SQLAlchemy
         session_factory (Optional[async_sessionmaker[AsyncSession]]): Фабрика для создания сессий
+        isolation_session_factories (dict[str, async_sessionmaker[AsyncSession]]): Фабрики сессий
+            для отдельных уровней изоляции (включая AUTOCOMMIT для чтения без транзакции)
     """
 
     def __init__(
             self,
             database_url: str,
             session_factory: async_sessionmaker[AsyncSession] | None = None,
-            engine: AsyncEngine | None = None
+            engine: AsyncEngine | None = None,
+            engine_options: dict | None = None,
+            pool_warmup: bool = False
     ) -> None:
         """Инициализация менеджера сессий.
 
@@ -40,21 +55,78 @@ class DatabaseSessionManager:
             database_url: URL для подключения к БД
             session_factory: Опциональная фабрика сессий
             engine: Опциональный существующий движок
+            engine_options: Опциональные параметры для create_async_engine
+            pool_warmup: Открывать соединения пула заранее при инициализации
         """
         self.database_url = database_url
+        self.engine_options = engine_options or {}
+        self.pool_warmup = pool_warmup
         self.engine = engine
         self.session_factory = session_factory
+        self.isolation_session_factories: dict[str, async_sessionmaker[AsyncSession]] = {}
 
     async def init(self):
         """Инициализирует движок базы данных и фабрику сессий."""
         self.engine = create_async_engine(
             url=self.database_url,
+            poolclass=AsyncAdaptedQueuePool,
+            **self.engine_options,
         )
         self.session_factory = async_sessionmaker(
             bind=self.engine,
             expire_on_commit=False,
             autoflush=False
         )
+        self.isolation_session_factories = {}
+
+        if self.pool_warmup:
+            await self.warmup()
+
+    async def warmup(self):
+        """Заранее открывает все постоянные соединения пула.
+
+        Первые запросы после старта не тратят время на установку соединения с БД.
+        Ошибка прогрева не прерывает запуск: соединения будут открыты по требованию.
+        """
+        size = self.engine.pool.size()
+        results = await asyncio.gather(
+            *(self.engine.connect() for _ in range(size)),
+            return_exceptions=True
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        for connection in results:
+            if not isinstance(connection, BaseException):
+                await connection.close()
+        if errors:
+            logger.error("Ошибка прогрева пула соединений БД: {}", errors[0])
+        else:
+            logger.info("Пул соединений БД прогрет: {} соединений", size)
+
+    def get_session_factory(self, isolation_level: str | None = None) -> async_sessionmaker[AsyncSession]:
+        """Возвращает фабрику сессий для указанного уровня изоляции.
+
+        Фабрика для уровня изоляции создается один раз и привязывается к движку с
+        execution_options(isolation_level=...). Драйвер выставляет уровень при
+        начале транзакции, без отдельного запроса SET TRANSACTION.
+
+        Args:
+            isolation_level: Уровень изоляции ('READ COMMITTED', 'AUTOCOMMIT' и т.д.)
+                или None для фабрики по умолчанию
+
+        Returns:
+            async_sessionmaker[AsyncSession]: Фабрика сессий
+        """
+        if isolation_level is None:
+            return self.session_factory
+        factory = self.isolation_session_factories.get(isolation_level)
+        if factory is None:
+            factory = async_sessionmaker(
+                bind=self.engine.execution_options(isolation_level=isolation_level),
+                expire_on_commit=False,
+                autoflush=False
+            )
+            self.isolation_session_factories[isolation_level] = factory
+        return factory
 
     async def close(self):
         """Закрывает соединения с базой данных."""
@@ -71,14 +143,13 @@ class DatabaseSessionManager:
 
          Алгоритм работы:
         1. Фиксирует время начала операции
-        2. Создает новую сессию через session_factory
-        3. Если указан isolation_level - устанавливает его для транзакции
-        4. Возвращает сессию через yield (точка входа в контекст)
-        5. При выходе из контекста:
+        2. Создает новую сессию через фабрику для указанного isolation_level
+        3. Возвращает сессию через yield (точка входа в контекст)
+        4. При выходе из контекста:
            - Если commit=True -> выполняет commit
            - В случае ошибки -> выполняет rollback
-           - В любом случае закрывает сессию
-        6. Логирует время выполнения операции
+           - В любом случае закрывает сессию (при выходе из async with)
+        5. Логирует время выполнения операции
 
         Args:
             isolation_level: Уровень изоляции транзакции (None, 'READ COMMITTED' и т.д.)
@@ -90,16 +161,10 @@ class DatabaseSessionManager:
         Raises:
             Exception: Любые ошибки при работе с БД
         """
-        start_time = datetime.now()
-        logger.info(f"Создание новой сессии. Изоляция: {isolation_level}, Автокоммит: {commit}")
-        async with self.session_factory() as session:
+        start_time = time.monotonic_ns()
+        logger.info("Создание новой сессии. Изоляция: {}, Автокоммит: {}", isolation_level, commit)
+        async with self.get_session_factory(isolation_level)() as session:
             try:
-                if isolation_level:
-                    logger.debug(f"Установка уровня изоляции: {isolation_level}")
-                    await session.execute(
-                        text(f"SET TRANSACTION ISOLATION LEVEL {isolation_level}")
-                    )
-
                 yield session
 
                 if commit:
@@ -112,11 +177,31 @@ class DatabaseSessionManager:
                 logger.info("Выполнен откат транзакции")
                 raise
             finally:
-                await session.close()
-                exec_time = (datetime.now() - start_time).total_seconds()
-                logger.info(f"Сессия закрыта. Время выполнения: {exec_time:.2f} сек")
+                exec_time = (time.monotonic_ns() - start_time) / 1e9
+                logger.info("Сессия закрыта. Время выполнения: {:.2f} сек", exec_time)
+
+    @asynccontextmanager
+    async def readonly_session(self) -> AsyncIterator[AsyncSession]:
+        """Контекстный менеджер для сессий только на чтение.
+
+        Сессия работает в режиме AUTOCOMMIT: запросы выполняются без
+        BEGIN/ROLLBACK, что экономит обращения к БД на простых выборках.
+        Не предназначена для изменения данных.
+
+        Yields:
+            AsyncSession: Асинхронная сессия базы данных
+        """
+        start_time = time.monotonic_ns()
+        logger.info("Создание новой сессии только на чтение")
+        async with self.get_session_factory("AUTOCOMMIT")() as session:
+            try:
+                yield session
+            finally:
+                exec_time = (time.monotonic_ns() - start_time) / 1e9
+                logger.info("Сессия закрыта. Время выполнения: {:.2f} сек", exec_time)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def dependency(isolation_level: str | None = None, commit: bool = False):
         """Создает зависимость FastAPI для работы с сессиями.
 
@@ -126,6 +211,10 @@ class DatabaseSessionManager:
         3. Использует session() как контекстный менеджер
         4. Возвращает зависимость FastAPI для внедрения сессии
 
+        Результат кэшируется: для одинаковых (isolation_level, commit) возвращается
+        одна и та же зависимость, поэтому FastAPI не создает для них отдельные сессии
+        в рамках одного запроса и dependency_overrides применяется ко всем местам сразу.
+
         Args:
             isolation_level: Уровень изоляции транзакции
             commit: Флаг автоматического коммита
@@ -154,7 +243,15 @@ class DatabaseSessionManager:
         1. Создает новую сессию с указанным уровнем изоляции
         2. Передает сессию в декорируемую функцию
         3. Обрабатывает коммит/откат транзакции
-        4. Гарантирует закрытие сессии
+        4. Гарантирует закрытие сессии (при выходе из async with)
+
+        Если декорированная функция вызвана внутри другой, уже открывшей сессию
+        через connection(), и не требует ничего сверх внешней сессии (commit=False,
+        уровень изоляции не указан или совпадает с внешним) и выполняется в той же
+        задаче asyncio, используется внешняя сессия: новая не создается, а
+        коммит/откат остаются за внешним вызовом. Иначе (в том числе для вызовов
+        из asyncio.gather и create_task) открывается отдельная сессия, как при
+        вызове верхнего уровня.
 
         Args:
             isolation_level: Уровень изоляции транзакции
@@ -167,14 +264,21 @@ class DatabaseSessionManager:
         def decorator(method):
             @wraps(method)
             async def wrapper(*args, **kwargs):
-                start_time = datetime.now()
-                logger.info(f"Начало транзакции для {method.__name__}. Изоляция: {isolation_level}")
-                async with self.session_factory() as session:
+                current = _current_session.get()
+                if current is not None and not commit:
+                    current_session, current_isolation_level, owner_task = current
+                    if (
+                            owner_task is asyncio.current_task()
+                            and (isolation_level is None or isolation_level == current_isolation_level)
+                    ):
+                        return await method(*args, session=current_session, **kwargs)
+
+                start_time = time.monotonic_ns()
+                logger.info("Начало транзакции для {}. Изоляция: {}", method.__name__, isolation_level)
+                async with self.get_session_factory(isolation_level)() as session:
+                    token = _current_session.set((session, isolation_level, asyncio.current_task()))
                     try:
-                        if isolation_level:
-                            logger.debug(f"Установка уровня изоляции: {isolation_level}")
-                            await session.execute(text(f"SET TRANSACTION ISOLATION LEVEL {isolation_level}"))
-                        logger.debug(f"Выполнение метода {method.__name__}")
+                        logger.debug("Выполнение метода {}", method.__name__)
                         result = await method(*args, session=session, **kwargs)
                         if commit:
                             logger.debug("Выполнение коммита изменений")
@@ -187,9 +291,9 @@ class DatabaseSessionManager:
                         logger.info("Выполнен откат транзакции")
                         raise
                     finally:
-                        await session.close()
-                        exec_time = (datetime.now() - start_time).total_seconds()
-                        logger.info(f"Транзакция завершена. Время выполнения: {exec_time:.2f} сек")
+                        _current_session.reset(token)
+                        exec_time = (time.monotonic_ns() - start_time) / 1e9
+                        logger.info("Транзакция завершена. Время выполнения: {:.2f} сек", exec_time)
 
             return wrapper
 
@@ -197,7 +301,11 @@ class DatabaseSessionManager:
 
 
 # Глобальный экземпляр менеджера сессий
-session_manager = DatabaseSessionManager(SQL_DATABASE_URL)
+session_manager = DatabaseSessionManager(
+    SQL_DATABASE_URL,
+    engine_options=config.database_config.engine_options,
+    pool_warmup=config.database_config.DB_POOL_WARMUP,
+)
 # Или вы можете инициализировать его так, для использования вне FastAPI:
 #
 # engine = create_async_engine(SQL_DATABASE_URL, future=True)
@@ -1,4 +1,5 @@
 import logging
+import sys
 from loguru import logger
 from pathlib import Path
 
@@ -8,24 +9,33 @@ from .config import config
 class InterceptHandler(logging.Handler):
     """Обработчик для перехвата стандартных логов Python и перенаправления их в Loguru.
 
+    Attributes:
+        _level_cache: Соответствие имен уровней logging уровням Loguru
+
     Methods:
         emit: Перехватывает и обрабатывает каждое лог-сообщение.
     """
+    _level_cache: dict[str, str | int] = {}
+
     def emit(self, record):
         """Перехватывает лог-запись и перенаправляет ее в Loguru.
 
         Args:
             record (logging.LogRecord): Запись лога из стандартной библиотеки logging
         """
-        # Получаем соответствующий уровень логирования Loguru
-        try:
-            level = logger.level(record.levelname).name
-        except ValueError:
-            level = record.levelno
-
-        # Ищем место вызова для правильной глубины стека
-        frame, depth = logging.currentframe(), 2
-        while frame.f_back and frame.f_code.co_filename == logging.__file__:
+        # Получаем соответствующий уровень логирования Loguru (один раз на имя уровня)
+        level = self._level_cache.get(record.levelname)
+        if level is None:
+            try:
+                level = logger.level(record.levelname).name
+            except ValueError:
+                level = record.levelno
+            self._level_cache[record.levelname] = level
+
+        # Ищем место вызова для правильной глубины стека. Глубина зависит от
+        # библиотеки, которая пишет лог (uvicorn, asyncio, sqlalchemy), поэтому не фиксируется
+        frame, depth = sys._getframe(1), 1
+        while frame and frame.f_code.co_filename == logging.__file__:
             frame = frame.f_back
             depth += 1
 
@@ -60,6 +70,18 @@ def setup_logger():
         logging_logger.handlers = []
         logging_logger.propagate = True
 
+    # Заменяем стандартный обработчик loguru (уровень DEBUG) на консольный обработчик.
+    # В консоль пишутся только предупреждения и ошибки (CONSOLE_LEVEL), полный лог - в файл.
+    # При enqueue запись выполняется в отдельном потоке и не блокирует цикл событий
+    logger.remove()
+    logger.add(
+        sys.stderr,
+        level=config.logger_config.CONSOLE_LEVEL,
+        backtrace=config.logger_config.BACKTRACE,
+        diagnose=config.logger_config.DIAGNOSE,
+        enqueue=config.logger_config.ENQUEUE,
+    )
+
     logger.add(
         Path(__file__).parent.parent / "app.log",
         rotation=config.logger_config.ROTATION,
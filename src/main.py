@@ -1,10 +1,11 @@
+import asyncio
 import uvicorn
 from fastapi import FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
 from pathlib import Path
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from sqladmin import Admin
 
 from src.redis_database.client import redis_manager
@@ -18,6 +19,7 @@ from src.admin.models import UserAdmin
 from src.admin.router import admin_router
 from src.auth.http_handler import unauthorised_exception_handler
 from src.admin.templates_router import admin_template_router
+from src.utils import install_shared_responses, install_openapi_cache
 
 
 @asynccontextmanager
@@ -29,8 +31,10 @@ async def lifespan(app: FastAPI):
     2. Инициализация Redis менеджера и сохранение в app.state
     3. Инициализация менеджера сессий БД и сохранение в app.state
     4. Инициализация админки
-    5. Возврат управления приложению (yield)
-    6. По завершении работы:
+    5. Запуск фонового обновления списка администраторов
+    6. Возврат управления приложению (yield)
+    7. По завершении работы:
+       - Остановка фонового обновления списка администраторов
        - Закрытие соединений Redis
        - Закрытие соединений с БД
 
@@ -50,9 +54,20 @@ async def lifespan(app: FastAPI):
     admin = Admin(app, session_manager.engine)
     admin.add_view(UserAdmin)
 
+    # Фоновое обновление списка администраторов для AdminPermissionMiddleware
+    admin_ids_task = asyncio.create_task(
+        AdminPermissionMiddleware.refresh_admin_ids(
+            session_manager,
+            config.auth_config.ADMIN_IDS_REFRESH_INTERVAL
+        )
+    )
+
     yield
 
     # Очистка
+    admin_ids_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await admin_ids_task
     await redis_manager.close()
     await session_manager.close()
 
@@ -65,6 +80,8 @@ def create_app() -> FastAPI:
     2. Добавляет CORS middleware
     3. Добавляет middleware для валидации токенов
     4. Подключает роутеры
+    5. Выносит повторяющиеся ответы-ошибки в общие компоненты OpenAPI и кэширует /openapi.json
+    6. Заранее собирает стек middleware
 
     Returns:
         FastAPI: Настроенный экземпляр FastAPI приложения
@@ -93,6 +110,11 @@ def create_app() -> FastAPI:
     app.include_router(auth_templates_routes)
     app.include_router(admin_router)
     app.include_router(admin_template_router)
+    install_shared_responses(app)
+    install_openapi_cache(app)
+    # Собираем стек middleware при создании приложения, а не на первом запросе.
+    # После этого add_middleware и add_exception_handler больше не вызываются
+    app.middleware_stack = app.build_middleware_stack()
     return app
 
 
@@ -105,6 +127,8 @@ if __name__ == '__main__':
     3. Запуск сервера uvicorn с параметрами:
        - Хост: 0.0.0.0 (доступ с любых интерфейсов)
        - Порт: 5000
+       - Цикл событий и HTTP-парсер выбираются uvicorn автоматически
+         (uvloop и httptools, если они установлены)
     4. Обработка возможных ошибок запуска
     """
     try:
@@ -1,10 +1,11 @@
+import time
 from typing import AsyncIterator, Optional
 from contextlib import asynccontextmanager
-from datetime import datetime
+from functools import lru_cache
 from loguru import logger
 from fastapi import Depends
 from typing_extensions import Annotated
-from redis.asyncio import Redis, ConnectionPool
+from redis.asyncio import Redis, ConnectionPool, BlockingConnectionPool
 from fastapi import Request
 
 from ..config import config
@@ -21,29 +22,57 @@ class RedisClientManager:
 
     Attributes:
         redis_url (str): URL для подключения к Redis
+        max_connections (int): Максимальное количество соединений в пуле
+        pool_timeout (int): Время ожидания свободного соединения (в секундах)
         connection_pool (Optional[ConnectionPool]): Пул подключений Redis
+        client (Optional[Redis]): Общий клиент Redis поверх пула подключений
     """
-    def __init__(self, redis_url: str, connection_pool: ConnectionPool | None = None):
+    def __init__(
+            self,
+            redis_url: str,
+            connection_pool: ConnectionPool | None = None,
+            max_connections: int = 50,
+            pool_timeout: int = 2,
+    ):
         """Инициализация менеджера подключений.
 
         Args:
             redis_url: URL для подключения к Redis
             connection_pool: Опциональный существующий пул подключений
+            max_connections: Максимальное количество соединений в пуле
+            pool_timeout: Время ожидания свободного соединения (в секундах)
         """
         self.redis_url = redis_url
+        self.max_connections = max_connections
+        self.pool_timeout = pool_timeout
         self.connection_pool: ConnectionPool | None = connection_pool
+        self.client: Redis | None = None
 
     async def init(self):
-        """Инициализирует пул подключений Redis"""
-        self.connection_pool = ConnectionPool.from_url(
+        """Инициализирует ограниченный пул подключений Redis и проверяет соединение.
+
+        При исчерпании пула запросы ждут свободное соединение не дольше
+        pool_timeout секунд, вместо открытия неограниченного числа соединений.
+        Клиент Redis создается один раз и переиспользуется всеми запросами:
+        соединения по-прежнему берутся из пула на каждую операцию.
+        """
+        self.connection_pool = BlockingConnectionPool.from_url(
             url=self.redis_url,
+            max_connections=self.max_connections,
+            timeout=self.pool_timeout,
             encoding="utf-8",
             decode_responses=True,
         )
+        self.client = Redis(connection_pool=self.connection_pool, single_connection_client=False)
+        async with self.get_client() as client:
+            await client.ping()
         logger.info("Redis connection pool initialized")
 
     async def close(self):
-        """Закрывает пул подключений Redis"""
+        """Закрывает общий клиент и пул подключений Redis"""
+        if self.client:
+            await self.client.aclose()
+            self.client = None
         if self.connection_pool:
             await self.connection_pool.aclose()
             logger.info("Redis connection pool closed")
@@ -55,11 +84,8 @@ class RedisClientManager:
         Алгоритм работы:
         1. Проверяет инициализацию пула подключений
         2. Фиксирует время начала операции
-        3. Получает клиента из пула подключений
-        4. Возвращает клиента через yield
-        5. По завершении:
-           - Закрывает клиента
-           - Логирует время выполнения
+        3. Возвращает общий клиент через yield
+        4. По завершении логирует время выполнения
 
         Yields:
             Redis: Асинхронный клиент Redis
@@ -67,22 +93,28 @@ class RedisClientManager:
         Raises:
             RuntimeError: Если пул подключений не инициализирован
         """
-        if not self.connection_pool:
+        if not self.client:
             raise RuntimeError("Пулы redis не инициализированы")
 
-        start_time = datetime.now()
+        start_time = time.monotonic_ns()
         logger.debug("Получаю клиент redis из пулов")
 
-        redis_client = Redis(connection_pool=self.connection_pool)
         try:
-            yield redis_client
+            yield self.client
         finally:
-            await redis_client.aclose()
-            exec_time = (datetime.now() - start_time).total_seconds()
-            logger.debug(f"Клиент Redis выпущен. Время выполнения: {exec_time:.2f} сек")
+            exec_time = (time.monotonic_ns() - start_time) / 1e9
+            logger.debug("Клиент Redis выпущен. Время выполнения: {:.2f} сек", exec_time)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def dependency():
+        """Создает зависимость FastAPI для получения клиента Redis.
+
+        Результат кэшируется: все обработчики используют одну и ту же зависимость.
+
+        Returns:
+            Annotated[Redis, Depends]: Зависимость для внедрения клиента Redis
+        """
         async def get_session(request: Request):
             if not hasattr(request.app.state, 'redis_manager'):
                 raise RuntimeError("Менеджер Redis не инициализирован в app.state")
@@ -95,5 +127,9 @@ class RedisClientManager:
         return Annotated[Redis, Depends(get_session)]
 
 
-redis_manager = RedisClientManager(config.redis_config.redis_url)
+redis_manager = RedisClientManager(
+    config.redis_config.redis_url,
+    max_connections=config.redis_config.REDIS_MAX_CONNECTIONS,
+    pool_timeout=config.redis_config.REDIS_POOL_TIMEOUT,
+)
 RedisDepends = redis_manager.dependency
@@ -1,32 +1,62 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from functools import cached_property, lru_cache
 from pathlib import Path
 
+_ENV_FILE = Path(__file__).resolve().parents[2] / ".env"
+
+
 class RedisConfig(BaseSettings):
     """Класс конфигурации Redis.
 
     Загружает настройки из .env файла и предоставляет:
     - Параметры подключения к Redis
-    - Свойство для формирования URL подключения
+    - Свойство для формирования URL подключения (вычисляется один раз)
 
     Attributes:
         REDIS_PORT (int): Порт Redis сервера
         REDIS_HOST (str): Хост Redis сервера
         REDIS_PASSWORD (str): Пароль для аутентификации
         REDIS_DB (int): Номер базы данных (по умолчанию 0)
+        REDIS_MAX_CONNECTIONS (int): Максимальное количество соединений в пуле
+        REDIS_POOL_TIMEOUT (int): Время ожидания свободного соединения (в секундах)
     """
     REDIS_PORT: int
     REDIS_HOST: str
     REDIS_PASSWORD: str
     REDIS_DB: int = 0
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT: int = 2
 
     model_config = SettingsConfigDict(
-        env_file=Path(__file__).parent.parent.parent / ".env",
+        env_file=_ENV_FILE,
         env_file_encoding='utf-8',
         extra="ignore"
     )
 
-    @property
-    def redis_url(self):
+    @classmethod
+    def for_testing(cls, **overrides) -> "RedisConfig":
+        """Создает конфигурацию без чтения .env и переменных окружения.
+
+        Использует model_construct: значения не валидируются, поэтому подходит
+        только для тестов, где подключение к Redis подменяется.
+
+        Args:
+            **overrides: Значения полей, заменяющие тестовые по умолчанию
+
+        Returns:
+            RedisConfig: Конфигурация Redis для тестов
+        """
+        values = {
+            "REDIS_HOST": "localhost",
+            "REDIS_PORT": 6379,
+            "REDIS_PASSWORD": "",
+            "REDIS_DB": 0,
+        }
+        values.update(overrides)
+        return cls.model_construct(**values)
+
+    @cached_property
+    def redis_url(self) -> str:
         """Формирует URL для подключения к Redis.
 
         Формат URL:
@@ -36,3 +66,15 @@ class RedisConfig(BaseSettings):
             str: Полный URL для подключения к Redis
         """
         return f"redis://:{self.REDIS_PASSWORD}@{self.REDIS_HOST}:{self.REDIS_PORT}/{self.REDIS_DB}"
+
+
+@lru_cache(maxsize=1)
+def get_redis_config() -> RedisConfig:
+    """Возвращает конфигурацию Redis, созданную один раз на процесс.
+
+    .env файл читается и валидируется только при первом вызове.
+
+    Returns:
+        RedisConfig: Конфигурация Redis
+    """
+    return RedisConfig()
@@ -1,14 +1,51 @@
-from fastapi import status, HTTPException
+import orjson
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from fastapi import FastAPI, Request, Response, status, HTTPException
+from starlette.routing import Route
 
 from .schemes import DetailResponse
 
+# Быстрый кэш error_response_docs по id исключения. Вместе с результатом хранится
+# само исключение, чтобы его id не мог быть переиспользован другим объектом
+_error_docs_by_id: dict[tuple[int, str | None], tuple[HTTPException, Mapping[int, dict]]] = {}
 
+
+def _response_doc(status_code: int, description: str | None, example: dict) -> Mapping[int, dict]:
+    """Собирает описание ответа с моделью DetailResponse в формате OpenAPI.
+
+    Внешнее отображение доступно только для чтения, чтобы закэшированный результат
+    нельзя было изменить. Вложенное описание остается словарем: FastAPI требует
+    dict для дополнительных ответов и сам дополняет его схемой при генерации OpenAPI.
+
+    Args:
+        status_code: Статус ответа
+        description: Описание ответа для документации
+        example: Пример тела ответа
+
+    Returns:
+        Словарь с описанием ответа в формате OpenAPI
+    """
+    return MappingProxyType({
+        status_code: {
+            "model": DetailResponse,
+            "description": description,
+            "content": {"application/json": {"example": example}},
+        }
+    })
+
+
+@lru_cache(maxsize=256)
 def ok_response_docs(
         description: str | None = None,
         status_code: int = status.HTTP_200_OK,
-) -> dict:
+) -> Mapping[int, dict]:
     """Генерирует документацию для положительных ответов в формате OpenAPI.
 
+    Результат кэшируется и общий для всех вызовов с одинаковыми аргументами,
+    поэтому возвращается отображение только для чтения.
+
     Args:
         status_code: Статус ответа
         description: Описание ошибки для документации
@@ -16,25 +53,19 @@ def ok_response_docs(
     Returns:
         Словарь с описанием ошибки в формате OpenAPI
     """
-    return {
-        status_code: {
-            "model": DetailResponse,
-            "description": description,
-            "content": {
-                "application/json": {
-                    "example": {"detail": description}
-                }
-            }
-        }
-    }
+    return _response_doc(status_code, description, {"detail": description})
 
 
 def error_response_docs(
         error: HTTPException,
         description: str | None = None,
-) -> dict:
+) -> Mapping[int, dict]:
     """Генерирует документацию для ошибок в формате OpenAPI.
 
+    Результат кэшируется по статусу, detail, заголовкам и описанию ошибки,
+    поэтому возвращается отображение только для чтения. Для уже встречавшегося
+    объекта исключения результат берется по его id без разбора заголовков.
+
     Args:
         error: Исключение HTTPException
         description: Описание ошибки для документации
@@ -42,17 +73,129 @@ def error_response_docs(
     Returns:
         Словарь с описанием ошибки в формате OpenAPI
     """
-    return {
-        error.status_code: {
-            "model": DetailResponse,
-            "description": description or error.detail,
-            "content": {
-                "application/json": {
-                    "example": {
-                        "detail": error.detail,
-                        **({"headers": error.headers} if error.headers else {})
-                    }
-                }
-            }
-        }
-    }
+    key = (id(error), description)
+    cached = _error_docs_by_id.get(key)
+    if cached is not None:
+        return cached[1]
+
+    headers = tuple(sorted(error.headers.items())) if error.headers else None
+    docs = _error_response_docs(error.status_code, error.detail, description, headers)
+    _error_docs_by_id[key] = (error, docs)
+    return docs
+
+
+@lru_cache(maxsize=256)
+def _error_response_docs(
+        status_code: int,
+        detail: str,
+        description: str | None,
+        headers: tuple[tuple[str, str], ...] | None,
+) -> Mapping[int, dict]:
+    """Строит документацию для ошибки по хешируемым параметрам HTTPException.
+
+    Args:
+        status_code: Статус ответа
+        detail: Сообщение ошибки
+        description: Описание ошибки для документации
+        headers: Заголовки ответа в виде отсортированных пар или None
+
+    Returns:
+        Словарь с описанием ошибки в формате OpenAPI
+    """
+    example = {"detail": detail}
+    if headers:
+        example["headers"] = dict(headers)
+    return _response_doc(status_code, description or detail, example)
+
+
+def _share_error_responses(openapi_schema: dict) -> None:
+    """Выносит повторяющиеся описания ошибок в components.responses.
+
+    Одинаковые ответы с кодом 4xx/5xx, встречающиеся в нескольких операциях,
+    заменяются ссылками $ref на общий компонент. Схема изменяется на месте.
+
+    Args:
+        openapi_schema: Сгенерированная OpenAPI схема приложения
+    """
+    operation_responses = [
+        operation["responses"]
+        for path_item in openapi_schema.get("paths", {}).values()
+        for operation in path_item.values()
+        if isinstance(operation, dict) and "responses" in operation
+    ]
+
+    usages: dict[bytes, list[tuple[dict, str]]] = {}
+    for responses in operation_responses:
+        for code, response in responses.items():
+            if code.isdigit() and int(code) >= 400 and "$ref" not in response:
+                key = orjson.dumps(response, option=orjson.OPT_SORT_KEYS)
+                usages.setdefault(key, []).append((responses, code))
+
+    existing = openapi_schema.get("components", {}).get("responses", {})
+    shared: dict[str, dict] = {}
+    for places in usages.values():
+        if len(places) < 2:
+            continue
+        responses, code = places[0]
+        name, index = f"Error{code}", 1
+        while name in shared or name in existing:
+            index += 1
+            name = f"Error{code}_{index}"
+        shared[name] = responses[code]
+        for responses, code in places:
+            responses[code] = {"$ref": f"#/components/responses/{name}"}
+
+    if shared:
+        openapi_schema.setdefault("components", {}).setdefault("responses", {}).update(shared)
+
+
+def install_shared_responses(app: FastAPI) -> None:
+    """Подключает вынос повторяющихся ответов-ошибок в общие компоненты OpenAPI.
+
+    Обработка выполняется один раз при первой генерации схемы, дальше
+    FastAPI отдает ее из app.openapi_schema.
+
+    Args:
+        app: Экземпляр FastAPI приложения
+    """
+    generate_openapi = app.openapi
+
+    def openapi() -> dict:
+        if app.openapi_schema is None:
+            _share_error_responses(generate_openapi())
+        return app.openapi_schema
+
+    app.openapi = openapi
+
+
+def install_openapi_cache(app: FastAPI) -> None:
+    """Отдает /openapi.json из заранее сериализованных байт.
+
+    Стандартный обработчик FastAPI кэширует саму схему, но кодирует ее в JSON
+    на каждый запрос. Здесь схема кодируется через orjson один раз для каждого
+    root_path и дальше отдается как есть.
+
+    Args:
+        app: Экземпляр FastAPI приложения
+    """
+    if not app.openapi_url:
+        return
+
+    encoded: dict[str, bytes] = {}
+
+    async def openapi(request: Request) -> Response:
+        root_path = request.scope.get("root_path", "").rstrip("/")
+        body = encoded.get(root_path)
+        if body is None:
+            schema = app.openapi()
+            if root_path and app.root_path_in_servers:
+                server_urls = {server.get("url") for server in schema.get("servers", [])}
+                if root_path not in server_urls:
+                    schema = dict(schema)
+                    schema["servers"] = [{"url": root_path}] + schema.get("servers", [])
+            body = encoded[root_path] = orjson.dumps(schema)
+        return Response(body, media_type="application/json")
+
+    for index, route in enumerate(app.router.routes):
+        if isinstance(route, Route) and route.path == app.openapi_url:
+            app.router.routes[index] = Route(app.openapi_url, openapi, include_in_schema=False)